@@ -58,6 +58,7 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(default="json", description="Log format (json/text)")
+    log_stack_info: bool = Field(default=False, description="Render stack_info=True in log events")
     
     # Rate Limiting
     rate_limit_requests: int = Field(default=100, ge=1, description="Max requests per period")
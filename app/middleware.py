@@ -2,12 +2,11 @@
 
 import time
 from typing import Callable
-from uuid import uuid4
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
-from app.utils.logger import get_logger, set_correlation_id
+from app.utils.logger import correlation_scope, get_logger
 
 logger = get_logger(__name__)
 
@@ -17,56 +16,54 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request."""
-        correlation_id = request.headers.get("X-Correlation-ID") or str(uuid4())
-        set_correlation_id(correlation_id)
-        
-        # Record start time
-        start_time = time.perf_counter()
-        
-        # Get client IP
-        client_ip = request.client.host if request.client else "unknown"
-        forwarded_for = request.headers.get("X-Forwarded-For")
-        if forwarded_for:
-            client_ip = forwarded_for.split(",")[0].strip()
-        
-        logger.info(
-            "Request started",
-            method=request.method,
-            path=request.url.path,
-            query=str(request.query_params) if request.query_params else None,
-            client_ip=client_ip,
-            user_agent=request.headers.get("User-Agent"),
-        )
-        
-        try:
-            response = await call_next(request)
-        except Exception as e:
+        with correlation_scope(request.headers.get("X-Correlation-ID")) as correlation_id:
+            # Record start time
+            start_time = time.perf_counter()
+            
+            # Get client IP
+            client_ip = request.client.host if request.client else "unknown"
+            forwarded_for = request.headers.get("X-Forwarded-For")
+            if forwarded_for:
+                client_ip = forwarded_for.split(",")[0].strip()
+            
+            logger.info(
+                "Request started",
+                method=request.method,
+                path=request.url.path,
+                query=str(request.query_params) if request.query_params else None,
+                client_ip=client_ip,
+                user_agent=request.headers.get("User-Agent"),
+            )
+            
+            try:
+                response = await call_next(request)
+            except Exception as e:
+                process_time = time.perf_counter() - start_time
+                logger.error(
+                    "Request failed with unhandled exception",
+                    method=request.method,
+                    path=request.url.path,
+                    duration_ms=round(process_time * 1000, 2),
+                    error=str(e),
+                    exc_info=True,
+                )
+                raise
+            
             process_time = time.perf_counter() - start_time
-            logger.error(
-                "Request failed with unhandled exception",
+            
+            log_method = logger.info if response.status_code < 400 else logger.warning
+            log_method(
+                "Request completed",
                 method=request.method,
                 path=request.url.path,
+                status_code=response.status_code,
                 duration_ms=round(process_time * 1000, 2),
-                error=str(e),
-                exc_info=True,
             )
-            raise
-        
-        process_time = time.perf_counter() - start_time
-        
-        log_method = logger.info if response.status_code < 400 else logger.warning
-        log_method(
-            "Request completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=round(process_time * 1000, 2),
-        )
-        
-        response.headers["X-Correlation-ID"] = correlation_id
-        response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
-        
-        return response
+            
+            response.headers["X-Correlation-ID"] = correlation_id
+            response.headers["X-Process-Time"] = str(round(process_time * 1000, 2))
+            
+            return response
 
 
 class SecurityHeadersMiddleware(BaseHTTPMiddleware):
@@ -5,7 +5,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, Enum, Index, String, Text, func
+from sqlalchemy import Boolean, DateTime, Enum, Index, String, Text, func, literal_column
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, validates
 
@@ -89,6 +89,30 @@ class User(Base):
         Index("ix_users_role_active", "role", "active"),
         Index("ix_users_created_at", "created_at"),
         Index("ix_users_last_name_first_name", "last_name", "first_name"),
+        # Prefix search (lower(col) LIKE 'x%'). On PostgreSQL a btree can only
+        # serve LIKE under the C collation or with *_pattern_ops, so the
+        # expression indexes use text_pattern_ops and username/email (stored
+        # lowercase) get pattern-ops companions to their unique indexes.
+        Index(
+            "ix_users_first_name_lower",
+            func.lower(literal_column("first_name")).label("first_name_lower"),
+            postgresql_ops={"first_name_lower": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_users_last_name_lower",
+            func.lower(literal_column("last_name")).label("last_name_lower"),
+            postgresql_ops={"last_name_lower": "text_pattern_ops"},
+        ),
+        Index(
+            "ix_users_username_pattern",
+            "username",
+            postgresql_ops={"username": "varchar_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_users_email_pattern",
+            "email",
+            postgresql_ops={"email": "varchar_pattern_ops"},
+        ).ddl_if(dialect="postgresql"),
     )
     
     @validates("username")
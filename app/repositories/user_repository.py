@@ -1,15 +1,42 @@
 """User repository."""
 
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, delete, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User, UserRole
 from app.schemas.user import UserCreate, UserFilters, UserUpdate
 
+# Dialect-specific INSERT constructs supporting ON CONFLICT
+_UPSERT_INSERTS = {
+    "postgresql": pg_insert,
+    "sqlite": sqlite_insert,
+}
+
+
+def _prefix_pattern(term: str) -> str:
+    """Build a LIKE prefix pattern, escaping the term's own wildcards."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{escaped}%"
+
+
+def _taken_field(username: Optional[str], taken_usernames: Set[str]) -> Optional[str]:
+    """Name the conflicting field given the usernames of conflicting rows."""
+    if not taken_usernames:
+        return None
+    return "username" if username and username.lower() in taken_usernames else "email"
+
+
+def _validated(values: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the model's @validates normalisation, which Core INSERT/UPDATE skip."""
+    user = User(**values)
+    return {key: getattr(user, key) for key in values}
+
 
 class UserRepository:
     """User CRUD repository."""
@@ -18,23 +45,70 @@ class UserRepository:
         """Init."""
         self._session = session
     
-    async def create(self, user_data: UserCreate) -> User:
-        """Create user."""
-        user = User(
-            id=str(uuid4()),
-            username=user_data.username,
-            email=user_data.email,
-            first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            role=UserRole(user_data.role) if isinstance(user_data.role, str) else user_data.role,
-            active=user_data.active,
+    async def create_if_absent(self, user_data: UserCreate) -> Optional[User]:
+        """Create user in one statement; None if username or email is taken."""
+        insert = _UPSERT_INSERTS[self._session.get_bind().dialect.name]
+        stmt = (
+            insert(User)
+            .values(
+                **_validated({
+                    "id": str(uuid4()),
+                    "username": user_data.username,
+                    "email": user_data.email,
+                    "first_name": user_data.first_name,
+                    "last_name": user_data.last_name,
+                    "role": UserRole(user_data.role) if isinstance(user_data.role, str) else user_data.role,
+                    "active": user_data.active,
+                })
+            )
+            .on_conflict_do_nothing()
+            .returning(User)
+        )
+        
+        result = await self._session.scalars(stmt)
+        return result.one_or_none()
+    
+    async def get_conflicting_field(
+        self,
+        username: Optional[str],
+        email: Optional[str],
+    ) -> Optional[str]:
+        """Get which unique field is taken, username first."""
+        conditions = []
+        if username:
+            conditions.append(User.username == username.lower())
+        if email:
+            conditions.append(User.email == email.lower())
+        if not conditions:
+            return None
+        
+        result = await self._session.execute(select(User.username).where(or_(*conditions)))
+        taken = set(result.scalars().all())
+        
+        return _taken_field(username, taken)
+    
+    async def get_update_conflict(
+        self,
+        user_id: str,
+        username: Optional[str],
+        email: Optional[str],
+    ) -> Tuple[bool, Optional[str]]:
+        """Check in one query whether user_id exists and which unique field another user holds."""
+        conditions = [User.id == user_id]
+        if username:
+            conditions.append(User.username == username.lower())
+        if email:
+            conditions.append(User.email == email.lower())
+        
+        result = await self._session.execute(
+            select(User.id, User.username).where(or_(*conditions))
         )
+        rows = result.all()
         
-        self._session.add(user)
-        await self._session.flush()
-        await self._session.refresh(user)
+        exists = any(row.id == user_id for row in rows)
+        taken = {row.username for row in rows if row.id != user_id}
         
-        return user
+        return exists, _taken_field(username, taken)
     
     async def get_by_id(self, user_id: str) -> Optional[User]:
         """Get by id."""
@@ -93,71 +167,62 @@ class UserRepository:
         
         return users, total
     
-    async def update(self, user_id: str, user_data: UserUpdate) -> Optional[User]:
-        """Update user."""
-        user = await self.get_by_id(user_id)
-        if not user:
-            return None
-        
-        # Update only provided fields
-        update_data = user_data.model_dump(exclude_unset=True, exclude_none=True)
-        
-        for field, value in update_data.items():
-            if field == "role" and isinstance(value, str):
-                value = UserRole(value)
-            setattr(user, field, value)
-        
-        await self._session.flush()
-        await self._session.refresh(user)
-        
-        return user
-    
-    async def delete(self, user_id: str) -> bool:
-        """Delete user."""
-        user = await self.get_by_id(user_id)
-        if not user:
-            return False
-        
-        await self._session.delete(user)
-        await self._session.flush()
+    async def get_after(
+        self,
+        after_id: Optional[str] = None,
+        limit: int = 20,
+        filters: Optional[UserFilters] = None,
+    ) -> List[User]:
+        """Get users ordered by id after a given id (keyset pagination, no total count)."""
+        stmt = select(User)
         
-        return True
-    
-    async def exists_by_username(self, username: str, exclude_id: Optional[str] = None) -> bool:
-        """Check username exists."""
-        stmt = select(func.count(User.id)).where(User.username == username.lower())
+        if filters:
+            conditions = self._build_filter_conditions(filters)
+            if conditions:
+                stmt = stmt.where(and_(*conditions))
         
-        if exclude_id:
-            stmt = stmt.where(User.id != exclude_id)
+        # Seek on the primary key index instead of scanning past an OFFSET
+        if after_id:
+            stmt = stmt.where(User.id > after_id)
+        stmt = stmt.order_by(User.id.asc()).limit(limit)
         
         result = await self._session.execute(stmt)
-        count = result.scalar() or 0
-        
-        return count > 0
+        return list(result.scalars().all())
     
-    async def exists_by_email(self, email: str, exclude_id: Optional[str] = None) -> bool:
-        """Check email exists."""
-        stmt = select(func.count(User.id)).where(User.email == email.lower())
-        
-        if exclude_id:
-            stmt = stmt.where(User.id != exclude_id)
+    async def update(self, user_id: str, user_data: UserUpdate) -> Optional[User]:
+        """Update user with UPDATE ... RETURNING; None if not found."""
+        # Update only provided fields
+        update_data = user_data.model_dump(exclude_unset=True, exclude_none=True)
         
-        result = await self._session.execute(stmt)
-        count = result.scalar() or 0
+        if isinstance(update_data.get("role"), str):
+            update_data["role"] = UserRole(update_data["role"])
         
-        return count > 0
+        stmt = (
+            update(User)
+            .where(User.id == user_id)
+            .values(**_validated(update_data))
+            .returning(User)
+        )
+        result = await self._session.scalars(
+            stmt,
+            execution_options={"populate_existing": True},
+        )
+        return result.one_or_none()
     
-    async def count_by_role(self, role: UserRole) -> int:
-        """Count by role."""
-        stmt = select(func.count(User.id)).where(User.role == role)
+    async def delete(self, user_id: str) -> Optional[str]:
+        """Delete user with a single DELETE ... RETURNING; the deleted id, or None."""
+        stmt = delete(User).where(User.id == user_id).returning(User.id)
         result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        return result.scalar_one_or_none()
     
-    async def count_active(self) -> int:
-        """Count active."""
-        stmt = select(func.count(User.id)).where(User.active == True)
+    async def count_by_role_and_status(self) -> List[Tuple[UserRole, bool, int]]:
+        """Count users grouped by role and active flag in one query."""
+        stmt = (
+            select(User.role, User.active, func.count(User.id))
+            .group_by(User.role, User.active)
+        )
         result = await self._session.execute(stmt)
-        return result.scalar() or 0
+        return [tuple(row) for row in result.all()]
     
     def _build_filter_conditions(self, filters: UserFilters) -> List:
         """Build filter conditions."""
@@ -183,13 +248,15 @@ class UserRepository:
             conditions.append(User.active == filters.active)
         
         if filters.search:
-            search_term = f"%{filters.search}%"
+            # Prefix match on lowercased values so the (lower-cased) indexes
+            # can serve it; username and email are stored lowercase already.
+            prefix = _prefix_pattern(filters.search.lower())
             conditions.append(
                 or_(
-                    User.username.ilike(search_term),
-                    User.email.ilike(search_term),
-                    User.first_name.ilike(search_term),
-                    User.last_name.ilike(search_term),
+                    User.username.like(prefix, escape="\\"),
+                    User.email.like(prefix, escape="\\"),
+                    func.lower(User.first_name).like(prefix, escape="\\"),
+                    func.lower(User.last_name).like(prefix, escape="\\"),
                 )
             )
         
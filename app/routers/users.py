@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database import get_db_session
@@ -15,7 +15,6 @@ from app.schemas.user import (
     UserUpdate,
 )
 from app.services.user_service import UserService
-from app.utils.exceptions import AppException
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -51,10 +50,7 @@ async def create_user(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Create a new user."""
-    try:
-        return await service.create_user(user_data)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.create_user(user_data)
 
 
 @router.get(
@@ -65,8 +61,13 @@ async def create_user(
     Retrieve a paginated list of users with optional filtering.
     
     **Pagination:**
-    - `page`: Page number (default: 1)
+    - `page`: Page number (default: 1). Deprecated in favour of `cursor`
     - `page_size`: Items per page (default: 20, max: 100)
+    - `cursor`: Keyset pagination. Pass an empty value for the first page,
+      then `meta.next_cursor` for the following ones. Cursor mode always
+      orders by `id` ascending: `page`, `sort_by` and `sort_desc` are ignored,
+      and `meta.total`, `meta.page` and `meta.total_pages` are `null` since
+      no total count is run
     
     **Filtering:**
     - `username`: Filter by username (partial match)
@@ -75,7 +76,7 @@ async def create_user(
     - `last_name`: Filter by last name (partial match)
     - `role`: Filter by role (exact match)
     - `active`: Filter by active status
-    - `search`: Search across all text fields
+    - `search`: Case-insensitive prefix search across username, email, first and last name
     
     **Sorting:**
     - `sort_by`: Field to sort by (default: created_at)
@@ -86,15 +87,16 @@ async def create_user(
     },
 )
 async def list_users(
-    page: int = Query(default=1, ge=1, description="Page number"),
+    page: int = Query(default=1, ge=1, description="Page number", deprecated=True),
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(default=None, description="Keyset pagination cursor"),
     username: Optional[str] = Query(default=None, description="Filter by username"),
     email: Optional[str] = Query(default=None, description="Filter by email"),
     first_name: Optional[str] = Query(default=None, description="Filter by first name"),
     last_name: Optional[str] = Query(default=None, description="Filter by last name"),
     role: Optional[UserRole] = Query(default=None, description="Filter by role"),
     active: Optional[bool] = Query(default=None, description="Filter by active status"),
-    search: Optional[str] = Query(default=None, description="Search across fields"),
+    search: Optional[str] = Query(default=None, description="Prefix search across fields"),
     sort_by: str = Query(default="created_at", description="Field to sort by"),
     sort_desc: bool = Query(default=True, description="Sort descending"),
     service: UserService = Depends(get_user_service),
@@ -116,6 +118,7 @@ async def list_users(
         filters=filters,
         sort_by=sort_by,
         sort_desc=sort_desc,
+        cursor=cursor,
     )
 
 
@@ -149,10 +152,7 @@ async def get_user_by_username(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Get user by username."""
-    try:
-        return await service.get_user_by_username(username)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.get_user_by_username(username)
 
 
 @router.get(
@@ -170,10 +170,7 @@ async def get_user_by_email(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Get user by email."""
-    try:
-        return await service.get_user_by_email(email)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.get_user_by_email(email)
 
 
 @router.get(
@@ -191,10 +188,7 @@ async def get_user(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Get user by ID."""
-    try:
-        return await service.get_user(user_id)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.get_user(user_id)
 
 
 @router.put(
@@ -220,10 +214,7 @@ async def update_user(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Update a user."""
-    try:
-        return await service.update_user(user_id, user_data)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.update_user(user_id, user_data)
 
 
 @router.patch(
@@ -248,10 +239,7 @@ async def partial_update_user(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Partial update a user."""
-    try:
-        return await service.update_user(user_id, user_data)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.update_user(user_id, user_data)
 
 
 @router.delete(
@@ -260,19 +248,20 @@ async def partial_update_user(
     summary="Delete user",
     description="Permanently delete a user from the system.",
     responses={
-        204: {"description": "User deleted successfully"},
+        204: {
+            "description": "User deleted successfully",
+            "headers": {"X-Deleted-Id": {"description": "ID of the deleted user"}},
+        },
         404: {"description": "User not found"},
     },
 )
 async def delete_user(
     user_id: str,
+    response: Response,
     service: UserService = Depends(get_user_service),
 ) -> None:
     """Delete a user."""
-    try:
-        await service.delete_user(user_id)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    response.headers["X-Deleted-Id"] = await service.delete_user(user_id)
 
 
 @router.post(
@@ -290,10 +279,7 @@ async def deactivate_user(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Deactivate a user."""
-    try:
-        return await service.deactivate_user(user_id)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.deactivate_user(user_id)
 
 
 @router.post(
@@ -311,7 +297,4 @@ async def activate_user(
     service: UserService = Depends(get_user_service),
 ) -> UserResponse:
     """Activate a user."""
-    try:
-        return await service.activate_user(user_id)
-    except AppException as e:
-        raise HTTPException(status_code=e.status_code, detail=e.to_dict()["error"])
+    return await service.activate_user(user_id)
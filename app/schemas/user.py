@@ -15,6 +15,11 @@ from pydantic import (
 )
 
 
+# Validation patterns, compiled once at import
+_USERNAME_RE = re.compile(r"^[a-z0-9][a-z0-9_-]*[a-z0-9]$|^[a-z0-9]$")
+_NAME_RE = re.compile(r"^[a-zA-ZÀ-ÿ][a-zA-ZÀ-ÿ\s\-\']*$")
+
+
 class UserRole(str, Enum):
     """User roles."""
     
@@ -107,7 +112,7 @@ class UserBase(BaseModel):
         v = v.lower().strip()
         
         # Check valid characters
-        if not re.match(r"^[a-z0-9][a-z0-9_-]*[a-z0-9]$|^[a-z0-9]$", v):
+        if not _USERNAME_RE.match(v):
             raise ValueError(
                 "Username must start and end with a letter or number, "
                 "and can only contain letters, numbers, underscores, and hyphens"
@@ -130,7 +135,7 @@ class UserBase(BaseModel):
         v = v.strip()
         
         # Allow letters, spaces, hyphens, and apostrophes for names like "O'Brien" or "Mary-Jane"
-        if not re.match(r"^[a-zA-ZÀ-ÿ][a-zA-ZÀ-ÿ\s\-\']*$", v):
+        if not _NAME_RE.match(v):
             field_name = info.field_name.replace("_", " ").title()
             raise ValueError(
                 f"{field_name} must contain only letters, spaces, hyphens, and apostrophes"
@@ -231,7 +236,7 @@ class UserUpdate(BaseModel):
         
         v = v.lower().strip()
         
-        if not re.match(r"^[a-z0-9][a-z0-9_-]*[a-z0-9]$|^[a-z0-9]$", v):
+        if not _USERNAME_RE.match(v):
             raise ValueError(
                 "Username must start and end with a letter or number"
             )
@@ -250,7 +255,7 @@ class UserUpdate(BaseModel):
         
         v = v.strip()
         
-        if not re.match(r"^[a-zA-ZÀ-ÿ][a-zA-ZÀ-ÿ\s\-\']*$", v):
+        if not _NAME_RE.match(v):
             field_name = info.field_name.replace("_", " ").title()
             raise ValueError(f"{field_name} must contain only letters")
         
@@ -317,12 +322,25 @@ class UserResponse(BaseModel):
 class PaginationMeta(BaseModel):
     """Pagination meta."""
     
-    total: int = Field(description="Total number of items")
-    page: int = Field(description="Current page number")
+    total: Optional[int] = Field(
+        default=None,
+        description="Total number of items (offset pagination only)"
+    )
+    page: Optional[int] = Field(
+        default=None,
+        description="Current page number (offset pagination only)"
+    )
     page_size: int = Field(description="Items per page")
-    total_pages: int = Field(description="Total number of pages")
+    total_pages: Optional[int] = Field(
+        default=None,
+        description="Total number of pages (offset pagination only)"
+    )
     has_next: bool = Field(description="Whether there is a next page")
     has_prev: bool = Field(description="Whether there is a previous page")
+    next_cursor: Optional[str] = Field(
+        default=None,
+        description="Opaque cursor for the next page (keyset pagination only)"
+    )
 
 
 class UserListResponse(BaseModel):
@@ -391,5 +409,5 @@ class UserFilters(BaseModel):
     )
     search: Optional[str] = Field(
         default=None,
-        description="Search across username, email, first_name, last_name"
+        description="Prefix search across username, email, first_name, last_name"
     )
@@ -1,11 +1,15 @@
 """User service."""
 
+import base64
+import binascii
 import math
+from collections import defaultdict
 from typing import Optional, Tuple
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.user import User
+from app.models.user import User, UserRole
 from app.repositories.user_repository import UserRepository
 from app.schemas.user import (
     PaginationMeta,
@@ -15,10 +19,37 @@ from app.schemas.user import (
     UserResponse,
     UserUpdate,
 )
-from app.utils.exceptions import ConflictException, NotFoundException, ValidationException
+from app.utils.exceptions import (
+    EMAIL_REGISTERED,
+    USERNAME_TAKEN,
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
 from app.utils.logger import LoggerMixin, get_logger
 
 
+def _encode_cursor(user_id: str) -> str:
+    """Encode a user id as an opaque pagination cursor."""
+    return base64.urlsafe_b64encode(user_id.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> str:
+    """Decode a pagination cursor back to a user id."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return base64.b64decode(padded, altchars=b"-_", validate=True).decode()
+    except (binascii.Error, UnicodeError, ValueError):
+        raise ValidationException(
+            message="Invalid pagination cursor",
+            errors=[{
+                "field": "cursor",
+                "message": "Cursor is malformed",
+                "type": "value_error",
+            }],
+        )
+
+
 class UserService(LoggerMixin):
     """User business logic service."""
     
@@ -36,7 +67,25 @@ class UserService(LoggerMixin):
             email=user_data.email,
         )
         
-        if await self._repository.exists_by_username(user_data.username):
+        user = await self._repository.create_if_absent(user_data)
+        
+        if user is None:
+            field = await self._repository.get_conflicting_field(
+                user_data.username, user_data.email
+            )
+            
+            if field == "email":
+                self._logger.warning(
+                    "Email already exists",
+                    email=user_data.email,
+                )
+                raise ConflictException(
+                    message=f"Email '{user_data.email}' is already registered",
+                    field="email",
+                    value=user_data.email,
+                    error_code=EMAIL_REGISTERED,
+                )
+            
             self._logger.warning(
                 "Username already exists",
                 username=user_data.username,
@@ -45,21 +94,9 @@ class UserService(LoggerMixin):
                 message=f"Username '{user_data.username}' is already taken",
                 field="username",
                 value=user_data.username,
+                error_code=USERNAME_TAKEN,
             )
         
-        if await self._repository.exists_by_email(user_data.email):
-            self._logger.warning(
-                "Email already exists",
-                email=user_data.email,
-            )
-            raise ConflictException(
-                message=f"Email '{user_data.email}' is already registered",
-                field="email",
-                value=user_data.email,
-            )
-        
-        user = await self._repository.create(user_data)
-        
         self._logger.info(
             "User created successfully",
             user_id=user.id,
@@ -117,15 +154,20 @@ class UserService(LoggerMixin):
         filters: Optional[UserFilters] = None,
         sort_by: str = "created_at",
         sort_desc: bool = True,
+        cursor: Optional[str] = None,
     ) -> UserListResponse:
-        """Get paginated list of users."""
+        """Get paginated list of users; a cursor switches to keyset pagination."""
         self._logger.debug(
             "Listing users",
             page=page,
             page_size=page_size,
+            cursor=cursor,
             filters=filters.model_dump() if filters else None,
         )
         
+        if cursor is not None:
+            return await self._list_users_after(cursor, page_size, filters)
+        
         skip = (page - 1) * page_size
         
         users, total = await self._repository.get_all(
@@ -158,6 +200,47 @@ class UserService(LoggerMixin):
             meta=meta,
         )
     
+    async def _list_users_after(
+        self,
+        cursor: str,
+        page_size: int,
+        filters: Optional[UserFilters],
+    ) -> UserListResponse:
+        """
+        Get a keyset page of users ordered by id; an empty cursor starts at the beginning.
+        
+        No total is counted, so each page costs an index seek regardless of
+        table size; ``total``, ``page`` and ``total_pages`` are left unset.
+        """
+        after_id = _decode_cursor(cursor) if cursor else None
+        
+        # Fetch one extra row to know whether another page follows
+        users = await self._repository.get_after(
+            after_id=after_id,
+            limit=page_size + 1,
+            filters=filters,
+        )
+        
+        has_next = len(users) > page_size
+        users = users[:page_size]
+        
+        meta = PaginationMeta(
+            page_size=page_size,
+            has_next=has_next,
+            has_prev=after_id is not None,
+            next_cursor=_encode_cursor(users[-1].id) if has_next else None,
+        )
+        
+        self._logger.debug(
+            "Users fetched",
+            count=len(users),
+        )
+        
+        return UserListResponse(
+            data=[UserResponse.model_validate(user) for user in users],
+            meta=meta,
+        )
+    
     async def update_user(self, user_id: str, user_data: UserUpdate) -> UserResponse:
         """Update an existing user."""
         self._logger.info(
@@ -166,37 +249,27 @@ class UserService(LoggerMixin):
             update_fields=list(user_data.model_dump(exclude_unset=True).keys()),
         )
         
-        existing_user = await self._repository.get_by_id(user_id)
-        if not existing_user:
+        if user_data.username or user_data.email:
+            # One query answers both, so a missing user is still a 404 first
+            exists, field = await self._repository.get_update_conflict(
+                user_id, user_data.username, user_data.email
+            )
+            if not exists:
+                self._logger.warning("User not found for update", user_id=user_id)
+                raise NotFoundException(resource="User", resource_id=user_id)
+            self._raise_update_conflict(field, user_data)
+        
+        try:
+            user = await self._repository.update(user_id, user_data)
+        except IntegrityError:
+            # Lost a race with a concurrent write on a unique column
+            self._logger.warning("Unique conflict on update", user_id=user_id)
+            raise ConflictException(message="Username or email is already in use")
+        
+        if not user:
             self._logger.warning("User not found for update", user_id=user_id)
             raise NotFoundException(resource="User", resource_id=user_id)
         
-        if user_data.username and user_data.username != existing_user.username:
-            if await self._repository.exists_by_username(user_data.username, exclude_id=user_id):
-                self._logger.warning(
-                    "Username conflict on update",
-                    username=user_data.username,
-                )
-                raise ConflictException(
-                    message=f"Username '{user_data.username}' is already taken",
-                    field="username",
-                    value=user_data.username,
-                )
-        
-        if user_data.email and user_data.email != existing_user.email:
-            if await self._repository.exists_by_email(user_data.email, exclude_id=user_id):
-                self._logger.warning(
-                    "Email conflict on update",
-                    email=user_data.email,
-                )
-                raise ConflictException(
-                    message=f"Email '{user_data.email}' is already registered",
-                    field="email",
-                    value=user_data.email,
-                )
-        
-        user = await self._repository.update(user_id, user_data)
-        
         self._logger.info(
             "User updated successfully",
             user_id=user_id,
@@ -204,25 +277,44 @@ class UserService(LoggerMixin):
         
         return UserResponse.model_validate(user)
     
-    async def delete_user(self, user_id: str) -> bool:
-        """Delete a user."""
+    def _raise_update_conflict(self, field: Optional[str], user_data: UserUpdate) -> None:
+        """Raise ConflictException for a taken username or email."""
+        if field == "username":
+            self._logger.warning(
+                "Username conflict on update",
+                username=user_data.username,
+            )
+            raise ConflictException(
+                message=f"Username '{user_data.username}' is already taken",
+                field="username",
+                value=user_data.username,
+                error_code=USERNAME_TAKEN,
+            )
+        
+        if field == "email":
+            self._logger.warning(
+                "Email conflict on update",
+                email=user_data.email,
+            )
+            raise ConflictException(
+                message=f"Email '{user_data.email}' is already registered",
+                field="email",
+                value=user_data.email,
+                error_code=EMAIL_REGISTERED,
+            )
+    
+    async def delete_user(self, user_id: str) -> str:
+        """Delete a user and return the id reported by the database."""
         self._logger.info("Deleting user", user_id=user_id)
         
-        existing_user = await self._repository.get_by_id(user_id)
-        if not existing_user:
+        deleted_id = await self._repository.delete(user_id)
+        if deleted_id is None:
             self._logger.warning("User not found for deletion", user_id=user_id)
             raise NotFoundException(resource="User", resource_id=user_id)
         
-        deleted = await self._repository.delete(user_id)
+        self._logger.info("User deleted successfully", user_id=deleted_id)
         
-        if deleted:
-            self._logger.info(
-                "User deleted successfully",
-                user_id=user_id,
-                username=existing_user.username,
-            )
-        
-        return deleted
+        return deleted_id
     
     async def deactivate_user(self, user_id: str) -> UserResponse:
         """Deactivate a user."""
@@ -240,22 +332,20 @@ class UserService(LoggerMixin):
     
     async def get_user_statistics(self) -> dict:
         """Get user statistics."""
-        from app.models.user import UserRole
-        
-        total_active = await self._repository.count_active()
-        admin_count = await self._repository.count_by_role(UserRole.ADMIN)
-        user_count = await self._repository.count_by_role(UserRole.USER)
-        guest_count = await self._repository.count_by_role(UserRole.GUEST)
+        rows = await self._repository.count_by_role_and_status()
         
-        _, total = await self._repository.get_all(skip=0, limit=1)
+        total = 0
+        active = 0
+        by_role = defaultdict(int, {role.value: 0 for role in UserRole})
+        for role, is_active, count in rows:
+            total += count
+            if is_active:
+                active += count
+            by_role[role.value] += count
         
         return {
             "total_users": total,
-            "active_users": total_active,
-            "inactive_users": total - total_active,
-            "by_role": {
-                "admin": admin_count,
-                "user": user_count,
-                "guest": guest_count,
-            },
+            "active_users": active,
+            "inactive_users": total - active,
+            "by_role": dict(by_role),
         }
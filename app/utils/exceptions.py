@@ -1,7 +1,29 @@
 """Custom exceptions."""
 
+import sys
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+# Error codes, interned so equality checks by consumers are identity checks
+INTERNAL_ERROR = sys.intern("INTERNAL_ERROR")
+NOT_FOUND = sys.intern("NOT_FOUND")
+CONFLICT = sys.intern("CONFLICT")
+USERNAME_TAKEN = sys.intern("USERNAME_TAKEN")
+EMAIL_REGISTERED = sys.intern("EMAIL_REGISTERED")
+VALIDATION_ERROR = sys.intern("VALIDATION_ERROR")
+UNAUTHORIZED = sys.intern("UNAUTHORIZED")
+FORBIDDEN = sys.intern("FORBIDDEN")
+DATABASE_ERROR = sys.intern("DATABASE_ERROR")
+EXTERNAL_SERVICE_ERROR = sys.intern("EXTERNAL_SERVICE_ERROR")
+
+
+@lru_cache(maxsize=256)
+def _not_found_template(resource: str, has_id: bool) -> str:
+    """Not-found message; the ID variant is a ``%s`` template."""
+    if has_id:
+        return resource.replace("%", "%%") + " with ID '%s' not found"
+    return f"{resource} not found"
+
 
 class AppException(Exception):
     """Base app exception."""
@@ -10,7 +32,7 @@ class AppException(Exception):
         self,
         message: str,
         status_code: int = 500,
-        error_code: str = "INTERNAL_ERROR",
+        error_code: str = INTERNAL_ERROR,
         details: Optional[Dict[str, Any]] = None,
     ):
         """Init."""
@@ -45,14 +67,14 @@ class NotFoundException(AppException):
         """Init."""
         if message is None:
             if resource_id:
-                message = f"{resource} with ID '{resource_id}' not found"
+                message = _not_found_template(resource, True) % (resource_id,)
             else:
-                message = f"{resource} not found"
+                message = _not_found_template(resource, False)
         
         super().__init__(
             message=message,
             status_code=404,
-            error_code="NOT_FOUND",
+            error_code=NOT_FOUND,
             details={"resource": resource, "resource_id": resource_id},
         )
 
@@ -65,6 +87,7 @@ class ConflictException(AppException):
         message: str = "Resource already exists",
         field: Optional[str] = None,
         value: Optional[str] = None,
+        error_code: str = CONFLICT,
     ):
         """
         Initialize conflict exception.
@@ -73,6 +96,7 @@ class ConflictException(AppException):
             message: Error message
             field: Field that caused the conflict
             value: Value that caused the conflict
+            error_code: Specific conflict code (e.g. USERNAME_TAKEN)
         """
         details = {}
         if field:
@@ -83,7 +107,7 @@ class ConflictException(AppException):
         super().__init__(
             message=message,
             status_code=409,
-            error_code="CONFLICT",
+            error_code=error_code,
             details=details,
         )
 
@@ -100,7 +124,7 @@ class ValidationException(AppException):
         super().__init__(
             message=message,
             status_code=422,
-            error_code="VALIDATION_ERROR",
+            error_code=VALIDATION_ERROR,
             details={"errors": errors or []},
         )
 
@@ -113,7 +137,7 @@ class UnauthorizedException(AppException):
         super().__init__(
             message=message,
             status_code=401,
-            error_code="UNAUTHORIZED",
+            error_code=UNAUTHORIZED,
         )
 
 
@@ -125,7 +149,7 @@ class ForbiddenException(AppException):
         super().__init__(
             message=message,
             status_code=403,
-            error_code="FORBIDDEN",
+            error_code=FORBIDDEN,
         )
 
 
@@ -145,7 +169,7 @@ class DatabaseException(AppException):
         super().__init__(
             message=message,
             status_code=500,
-            error_code="DATABASE_ERROR",
+            error_code=DATABASE_ERROR,
             details=details,
         )
 
@@ -166,6 +190,6 @@ class ExternalServiceException(AppException):
         super().__init__(
             message=message,
             status_code=502,
-            error_code="EXTERNAL_SERVICE_ERROR",
+            error_code=EXTERNAL_SERVICE_ERROR,
             details=details,
         )
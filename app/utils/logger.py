@@ -1,17 +1,24 @@
 """Logging config."""
 
+from __future__ import annotations
+
 import logging
 import sys
+from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 from uuid import uuid4
 
-import structlog
-from structlog.types import EventDict, Processor
-
 from app.config import settings
 
+if TYPE_CHECKING:
+    from structlog.types import EventDict, FilteringBoundLogger, Processor
+
+# structlog is imported on first use to keep it off the import path
+_structlog = None
+
 # Context variable for correlation ID (request tracing)
 correlation_id_var: ContextVar[Optional[str]] = ContextVar("correlation_id", default=None)
 
@@ -29,6 +36,18 @@ def set_correlation_id(correlation_id: Optional[str] = None) -> str:
     return correlation_id
 
 
+@contextmanager
+def correlation_scope(correlation_id: Optional[str] = None) -> Iterator[str]:
+    """Bind a correlation id (generated if missing or empty) for the block, then reset it."""
+    if not correlation_id:
+        correlation_id = str(uuid4())
+    token = correlation_id_var.set(correlation_id)
+    try:
+        yield correlation_id
+    finally:
+        correlation_id_var.reset(token)
+
+
 def add_correlation_id(
     logger: logging.Logger,
     method_name: str,
@@ -63,39 +82,59 @@ def add_service_info(
     return event_dict
 
 
-def setup_logging() -> None:
-    """Configure logging."""
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+@lru_cache(maxsize=None)
+def _build_shared_processors(production: bool) -> Tuple[Processor, ...]:
+    """Build the processor chain shared by structlog and stdlib records."""
+    import structlog
     
-    # Common processors
-    shared_processors: list[Processor] = [
+    processors: list[Processor] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         add_timestamp,
         add_correlation_id,
         add_service_info,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.StackInfoRenderer(),
-        structlog.processors.UnicodeDecoder(),
     ]
     
+    if settings.log_stack_info:
+        processors.append(structlog.processors.StackInfoRenderer())
+    
+    if not production:
+        # Stdlib-style "%s" args and bytes values are only expected from
+        # ad-hoc development logging; production code logs keyword-style.
+        processors += [
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.UnicodeDecoder(),
+        ]
+    
+    return tuple(processors)
+
+
+def setup_logging() -> None:
+    """Configure logging."""
+    import structlog
+    
+    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    
+    # Processor chains are fixed for the process lifetime, so each is built once
+    shared_processors = _build_shared_processors(production=settings.is_production)
+    
     if settings.log_format == "json" or settings.is_production:
         # JSON logging for production
-        shared_processors.append(structlog.processors.format_exc_info)
+        shared_processors += (structlog.processors.format_exc_info,)
         renderer = structlog.processors.JSONRenderer()
     else:
         # Colored console output for development
-        shared_processors.append(structlog.dev.set_exc_info)
+        shared_processors += (structlog.dev.set_exc_info,)
         renderer = structlog.dev.ConsoleRenderer(colors=True)
     
-    # Configure structlog
+    # Configure structlog; the filtering wrapper turns disabled levels into no-ops
     structlog.configure(
-        processors=shared_processors + [
+        processors=shared_processors + (
             structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
+        ),
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         cache_logger_on_first_use=True,
     )
     
@@ -130,17 +169,18 @@ def setup_logging() -> None:
     )
 
 
-def get_logger(name: Optional[str] = None) -> structlog.stdlib.BoundLogger:
+def get_logger(name: Optional[str] = None) -> FilteringBoundLogger:
     """Get logger."""
-    return structlog.get_logger(name)
+    global _structlog
+    if _structlog is None:
+        import structlog as _structlog
+    return _structlog.get_logger(name)
 
 
 class LoggerMixin:
     """Logger mixin."""
     
-    @property
-    def logger(self) -> structlog.stdlib.BoundLogger:
+    @cached_property
+    def logger(self) -> FilteringBoundLogger:
         """Logger."""
-        if not hasattr(self, "_logger"):
-            self._logger = get_logger(self.__class__.__name__)
-        return self._logger
+        return get_logger(self.__class__.__name__)
@@ -0,0 +1,29 @@
+"""
+UserCreate Benchmarks
+
+Micro-benchmarks for the validator-heavy UserCreate construction path.
+Excluded from the default run; execute with ``pytest -m benchmark``.
+"""
+
+import pytest
+
+from app.schemas.user import UserCreate
+
+USER_KWARGS = {
+    "username": "benchuser",
+    "email": "bench@example.com",
+    "first_name": "Bench",
+    "last_name": "User",
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("count", [1, 100, 10_000])
+def test_user_create(benchmark, count):
+    """Benchmark constructing ``count`` validated UserCreate instances."""
+    
+    def build():
+        for _ in range(count):
+            UserCreate(**USER_KWARGS)
+    
+    benchmark(build)
@@ -6,24 +6,35 @@ test client, and factory fixtures for creating test data.
 """
 
 import asyncio
-from typing import AsyncGenerator, Generator
-from uuid import uuid4
+import itertools
+import json
+import os
+import sys
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, AsyncGenerator, Generator, Iterator
 
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
-from httpx import AsyncClient
-from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event, insert
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession, create_async_engine
 from sqlalchemy.pool import StaticPool
 
 from app.config import Settings, get_settings
 from app.database import Base, get_db_session
-from app.main import app
 from app.models.user import User, UserRole
 
+if TYPE_CHECKING:
+    # FastAPI builds its OpenAPI models on import; keep it out of runs that
+    # only exercise schemas or services.
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
 
-# Test database URL (in-memory SQLite)
+
+# Test database URL (in-memory SQLite). Each pytest-xdist worker is its own
+# process, so every worker gets a private database and builds the schema once.
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
@@ -40,16 +51,29 @@ def get_test_settings() -> Settings:
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for each test case."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Use uvloop (installed with uvicorn[standard]) when available, except on Windows."""
+    if sys.platform != "win32":
+        try:
+            import uvloop
+        except ImportError:
+            pass
+        else:
+            return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def event_loop(event_loop_policy) -> Generator:
+    """Create a single event loop from ``event_loop_policy`` for the session."""
+    loop = event_loop_policy.new_event_loop()
     yield loop
     loop.close()
 
 
-@pytest_asyncio.fixture(scope="function")
+@pytest_asyncio.fixture(scope="session")
 async def test_engine():
-    """Create a test database engine."""
+    """Create a test database engine with the schema built once per session."""
     engine = create_async_engine(
         TEST_DATABASE_URL,
         connect_args={"check_same_thread": False},
@@ -57,6 +81,16 @@ async def test_engine():
         echo=False,
     )
     
+    # pysqlite defers BEGIN on its own, which breaks SAVEPOINT handling;
+    # disable that and emit BEGIN explicitly so nested transactions work.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
@@ -68,41 +102,155 @@ async def test_engine():
     await engine.dispose()
 
 
-@pytest_asyncio.fixture(scope="function")
-async def db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
-    """Create a test database session."""
-    async_session_factory = async_sessionmaker(
-        bind=test_engine,
-        class_=AsyncSession,
+@asynccontextmanager
+async def _outer_transaction(engine) -> AsyncGenerator[AsyncConnection, None]:
+    """Open a connection inside a transaction that is always rolled back."""
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        try:
+            yield conn
+        finally:
+            await trans.rollback()
+
+
+def _test_session(conn: AsyncConnection) -> AsyncSession:
+    """Create a session whose commits only release a SAVEPOINT on conn."""
+    return AsyncSession(
+        bind=conn,
         expire_on_commit=False,
-        autocommit=False,
         autoflush=False,
+        join_transaction_mode="create_savepoint",
     )
+
+
+@pytest_asyncio.fixture(scope="function")
+async def db_connection(test_engine) -> AsyncGenerator[AsyncConnection, None]:
+    """
+    Provide the connection holding the outer test transaction.
     
-    async with async_session_factory() as session:
-        yield session
-        await session.rollback()
+    Test classes that share rows across their tests override this with
+    ``class_db_connection``; see ``_ClassSharedSampleUser`` in test_users.py.
+    """
+    async with _outer_transaction(test_engine) as conn:
+        yield conn
+
+
+# pytest-asyncio 0.23 cannot resolve a loop for class-scoped async fixtures
+# declared in conftest, so these are sync fixtures driving the session loop.
+
+@pytest.fixture(scope="class")
+def class_db_connection(test_engine, event_loop) -> Generator[AsyncConnection, None, None]:
+    """Provide an outer transaction shared by every test in a class."""
+    transaction = _outer_transaction(test_engine)
+    conn = event_loop.run_until_complete(transaction.__aenter__())
+    
+    yield conn
+    
+    event_loop.run_until_complete(transaction.__aexit__(None, None, None))
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(test_engine, db_session) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client with overridden dependencies."""
+async def db_session(db_connection) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Create a test database session bound to an outer transaction.
+    
+    Each test runs inside its own SAVEPOINT and commits issued by the code
+    under test only release nested SAVEPOINTs. The test's SAVEPOINT is
+    rolled back on teardown, and the outer transaction when its scope
+    ends, so tests start from a known schema without re-running DDL.
+    
+    The factory fixtures and every request made through ``client`` share
+    this one session, so their awaits must stay sequential: an
+    AsyncSession does not allow concurrent operations (asyncio.gather).
+    """
+    savepoint = await db_connection.begin_nested()
+    session = _test_session(db_connection)
+    
+    try:
+        yield session
+    finally:
+        await session.close()
+        if savepoint.is_active:
+            await savepoint.rollback()
+
+
+@pytest.fixture(scope="session")
+def fastapi_app() -> "FastAPI":
+    """
+    Import the application on first use.
+    
+    Schema-only runs (e.g. ``pytest tests/test_schemas.py``) never request
+    it, so they skip app construction and logging setup entirely.
+    """
+    from app.main import app
+    
+    return app
+
+
+@contextmanager
+def _db_overrides(app: "FastAPI", session: AsyncSession) -> Iterator[None]:
+    """Route the app's DB session and settings dependencies for the block."""
     
     async def override_get_db():
-        yield db_session
+        yield session
     
+    snapshot = dict(app.dependency_overrides)
     app.dependency_overrides[get_db_session] = override_get_db
     app.dependency_overrides[get_settings] = get_test_settings
     
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    try:
+        yield
+    finally:
+        app.dependency_overrides.clear()
+        app.dependency_overrides.update(snapshot)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def client(test_engine, fastapi_app) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Create a single in-process test client shared by the whole session.
+    
+    One throwaway request is sent on creation so the first-request cost
+    (route, validator and serializer setup) is paid here once per session
+    or xdist worker, not by whichever test happens to run first.
+    """
+    async with AsyncClient(
+        transport=ASGITransport(app=fastapi_app),
+        base_url="http://test",
+    ) as ac:
+        async with _outer_transaction(test_engine) as conn:
+            session = _test_session(conn)
+            try:
+                with _db_overrides(fastapi_app, session):
+                    await ac.get("/api/v1/users")
+            finally:
+                await session.close()
+        
         yield ac
+
+
+@pytest.fixture(autouse=True)
+def _client_overrides(request) -> Generator[None, None, None]:
+    """Point the app at this test's db_session for tests using ``client``."""
+    if "client" not in request.fixturenames:
+        yield
+        return
     
-    app.dependency_overrides.clear()
+    app = request.getfixturevalue("fastapi_app")
+    db_session = request.getfixturevalue("db_session")
+    
+    with _db_overrides(app, db_session):
+        yield
 
 
 @pytest.fixture
-def sync_client(test_engine, db_session) -> Generator[TestClient, None, None]:
+def sync_client(
+    test_engine, db_session, fastapi_app
+) -> Generator["TestClient", None, None]:
     """Create a synchronous test client."""
+    from fastapi.testclient import TestClient
+    
+    app = fastapi_app
     
     async def override_get_db():
         yield db_session
@@ -118,12 +266,44 @@ def sync_client(test_engine, db_session) -> Generator[TestClient, None, None]:
 
 # Factory fixtures for creating test data
 
+_UUID_POOL_SIZE = 256
+
+# Monotonic, zero-padded suffix for generated usernames/emails: unique across
+# the session and sorts the same lexically and numerically.
+_SEQ = itertools.count()
+
+
+def _next_seq() -> str:
+    """Return the next generated-user suffix."""
+    return f"{next(_SEQ):08d}"
+
+
+def _uuids(n: int) -> list[str]:
+    """Generate n random UUID-formatted strings from a single urandom read."""
+    b = os.urandom(16 * n)
+    return [
+        f"{b[i:i+4].hex()}-{b[i+4:i+6].hex()}-{b[i+6:i+8].hex()}-"
+        f"{b[i+8:i+10].hex()}-{b[i+10:i+16].hex()}"
+        for i in range(0, 16 * n, 16)
+    ]
+
+
+# Shared by every factory so the pool is formatted once, not once per test
+_ID_POOL: deque[str] = deque()
+
+
+def _next_id() -> str:
+    """Pop an ID from the module-level pool, refilling it when empty."""
+    if not _ID_POOL:
+        _ID_POOL.extend(_uuids(_UUID_POOL_SIZE))
+    return _ID_POOL.popleft()
+
+
 class UserFactory:
     """Factory for creating test users."""
     
     def __init__(self, session: AsyncSession):
         self._session = session
-        self._counter = 0
     
     async def create(
         self,
@@ -135,15 +315,15 @@ class UserFactory:
         active: bool = True,
     ) -> User:
         """Create a test user in the database."""
-        self._counter += 1
+        seq = _next_seq()
         
         if username is None:
-            username = f"testuser{self._counter}"
+            username = f"testuser{seq}"
         if email is None:
-            email = f"testuser{self._counter}@example.com"
+            email = f"testuser{seq}@example.com"
         
         user = User(
-            id=str(uuid4()),
+            id=_next_id(),
             username=username.lower(),
             email=email.lower(),
             first_name=first_name,
@@ -152,22 +332,39 @@ class UserFactory:
             active=active,
         )
         
+        # Every column is filled client-side (ID pool, Python defaults), so
+        # no refresh SELECT is needed after the commit.
         self._session.add(user)
         await self._session.commit()
-        await self._session.refresh(user)
         
         return user
     
-    async def create_batch(self, count: int, **kwargs) -> list[User]:
-        """Create multiple test users."""
-        users = []
-        for i in range(count):
-            user = await self.create(
-                username=f"batchuser{self._counter + i}",
-                email=f"batchuser{self._counter + i}@example.com",
-                **kwargs,
-            )
-            users.append(user)
+    async def create_batch(
+        self,
+        count: int,
+        first_name: str = "Test",
+        last_name: str = "User",
+        role: UserRole = UserRole.USER,
+        active: bool = True,
+    ) -> list[User]:
+        """Create multiple test users with one multi-row INSERT and a single commit."""
+        rows = [
+            {
+                "id": _next_id(),
+                "username": f"batchuser{seq}",
+                "email": f"batchuser{seq}@example.com",
+                "first_name": first_name,
+                "last_name": last_name,
+                "role": role,
+                "active": active,
+            }
+            for seq in (_next_seq() for _ in range(count))
+        ]
+        
+        result = await self._session.scalars(insert(User).returning(User), rows)
+        users = list(result.all())
+        await self._session.commit()
+        
         return users
 
 
@@ -177,17 +374,34 @@ async def user_factory(db_session) -> UserFactory:
     return UserFactory(db_session)
 
 
+SAMPLE_USER_DATA = {
+    "username": "sampleuser",
+    "email": "sample@example.com",
+    "first_name": "Sample",
+    "last_name": "User",
+    "role": UserRole.USER,
+    "active": True,
+}
+
+
 @pytest_asyncio.fixture
 async def sample_user(user_factory) -> User:
     """Create a sample user for tests."""
-    return await user_factory.create(
-        username="sampleuser",
-        email="sample@example.com",
-        first_name="Sample",
-        last_name="User",
-        role=UserRole.USER,
-        active=True,
-    )
+    return await user_factory.create(**SAMPLE_USER_DATA)
+
+
+@pytest.fixture(scope="class")
+def class_sample_user(class_db_connection, event_loop) -> User:
+    """Create the sample user once in the class-wide outer transaction."""
+    
+    async def create() -> User:
+        session = _test_session(class_db_connection)
+        try:
+            return await UserFactory(session).create(**SAMPLE_USER_DATA)
+        finally:
+            await session.close()
+    
+    return event_loop.run_until_complete(create())
 
 
 @pytest_asyncio.fixture
@@ -216,19 +430,64 @@ async def inactive_user(user_factory) -> User:
     )
 
 
+@pytest_asyncio.fixture
+async def stats_seed(db_session) -> SimpleNamespace:
+    """Create a regular, an admin and an inactive user with a single flush."""
+    users = [
+        User(
+            username="sampleuser",
+            email="sample@example.com",
+            first_name="Sample",
+            last_name="User",
+            role=UserRole.USER,
+            active=True,
+        ),
+        User(
+            username="adminuser",
+            email="admin@example.com",
+            first_name="Admin",
+            last_name="User",
+            role=UserRole.ADMIN,
+            active=True,
+        ),
+        User(
+            username="inactiveuser",
+            email="inactive@example.com",
+            first_name="Inactive",
+            last_name="User",
+            role=UserRole.USER,
+            active=False,
+        ),
+    ]
+    
+    db_session.add_all(users)
+    await db_session.flush()
+    
+    return SimpleNamespace(sample=users[0], admin=users[1], inactive=users[2])
+
+
 # Test data fixtures
 
+VALID_USER_DATA = {
+    "username": "newuser",
+    "email": "newuser@example.com",
+    "first_name": "New",
+    "last_name": "User",
+    "role": "user",
+    "active": True,
+}
+
+
 @pytest.fixture
 def valid_user_data() -> dict:
     """Return valid user creation data."""
-    return {
-        "username": "newuser",
-        "email": "newuser@example.com",
-        "first_name": "New",
-        "last_name": "User",
-        "role": "user",
-        "active": True,
-    }
+    return dict(VALID_USER_DATA)
+
+
+@pytest.fixture(scope="session")
+def valid_user_body() -> bytes:
+    """Return valid user creation data serialized once as a JSON body."""
+    return json.dumps(VALID_USER_DATA).encode()
 
 
 @pytest.fixture
@@ -0,0 +1,35 @@
+"""
+Exception Tests
+
+Tests for the application exception hierarchy.
+"""
+
+import pickle
+
+import pytest
+
+from app.utils.exceptions import (
+    ConflictException,
+    NotFoundException,
+    ValidationException,
+)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        NotFoundException("User", "1"),
+        ConflictException("Username 'x' is already taken", field="username", value="x"),
+        ValidationException(errors=[{"field": "cursor", "message": "bad", "type": "value_error"}]),
+    ],
+    ids=["not_found", "conflict", "validation"],
+)
+def test_exception_pickle_round_trip(exc):
+    """Test that exceptions keep their fields through pickling."""
+    restored = pickle.loads(pickle.dumps(exc))
+    
+    assert type(restored) is type(exc)
+    assert restored.message == exc.message
+    assert restored.status_code == exc.status_code
+    assert restored.error_code == exc.error_code
+    assert restored.details == exc.details
@@ -4,14 +4,12 @@ Health Endpoint Tests
 Tests for health check and readiness probe endpoints.
 """
 
-import pytest
 from httpx import AsyncClient
 
 
 class TestHealthEndpoints:
     """Tests for health check endpoints."""
     
-    @pytest.mark.asyncio
     async def test_health_check(self, client: AsyncClient):
         """Test basic health check endpoint."""
         response = await client.get("/health")
@@ -22,7 +20,6 @@ class TestHealthEndpoints:
         assert data["status"] == "healthy"
         assert "timestamp" in data
     
-    @pytest.mark.asyncio
     async def test_liveness_probe(self, client: AsyncClient):
         """Test Kubernetes liveness probe."""
         response = await client.get("/health/live")
@@ -30,7 +27,18 @@ class TestHealthEndpoints:
         assert response.status_code == 200
         assert response.json()["status"] == "alive"
     
-    @pytest.mark.asyncio
+    async def test_correlation_id_echoed(self, client: AsyncClient):
+        """Test a provided correlation ID is echoed back."""
+        response = await client.get("/health/live", headers={"X-Correlation-ID": "abc-123"})
+        
+        assert response.headers["X-Correlation-ID"] == "abc-123"
+    
+    async def test_empty_correlation_id_is_generated(self, client: AsyncClient):
+        """Test an empty correlation ID header gets a generated ID."""
+        response = await client.get("/health/live", headers={"X-Correlation-ID": ""})
+        
+        assert response.headers["X-Correlation-ID"]
+    
     async def test_readiness_probe(self, client: AsyncClient):
         """Test Kubernetes readiness probe."""
         response = await client.get("/health/ready")
@@ -42,7 +50,6 @@ class TestHealthEndpoints:
         assert "checks" in data
         assert "database" in data["checks"]
     
-    @pytest.mark.asyncio
     async def test_detailed_health(self, client: AsyncClient):
         """Test detailed health check endpoint."""
         response = await client.get("/health/detailed")
@@ -60,7 +67,6 @@ class TestHealthEndpoints:
 class TestRootEndpoint:
     """Tests for root endpoint."""
     
-    @pytest.mark.asyncio
     async def test_root(self, client: AsyncClient):
         """Test root endpoint."""
         response = await client.get("/")
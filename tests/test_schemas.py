@@ -4,189 +4,131 @@ Schema Validation Tests
 Tests for Pydantic schema validation logic.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 import pytest
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
 from app.schemas.user import UserCreate, UserUpdate, UserRole
 
+ROLES = tuple(UserRole)
+
+# Shared validator for UserUpdate; test_partial_update_single_field keeps the class path
+_UPDATE_ADAPTER = TypeAdapter(UserUpdate)
+
+
+BASE_USER_KWARGS = {
+    "username": "testuser",
+    "email": "test@example.com",
+    "first_name": "Test",
+    "last_name": "User",
+}
+
+
+@lru_cache(maxsize=None)
+def _kw(overrides: frozenset) -> Mapping[str, Any]:
+    """Merge overrides into the baseline kwargs, cached per override set."""
+    return MappingProxyType({**BASE_USER_KWARGS, **dict(overrides)})
+
+
+def kw(**overrides) -> Mapping[str, Any]:
+    """Baseline valid UserCreate kwargs with only the field under test overridden."""
+    return _kw(frozenset(overrides.items()))
+
 
 class TestUserCreateValidation:
     """Tests for UserCreate schema validation."""
     
     def test_valid_user_create(self):
         """Test creating valid user schema."""
-        user = UserCreate(
+        user = UserCreate(**kw(
             username="validuser",
             email="valid@example.com",
             first_name="Valid",
-            last_name="User",
-        )
+        ))
         
         assert user.username == "validuser"
         assert user.email == "valid@example.com"
     
-    def test_username_lowercase_normalization(self):
-        """Test username is normalized to lowercase."""
-        user = UserCreate(
-            username="ValidUser",
-            email="test@example.com",
-            first_name="Test",
-            last_name="User",
-        )
-        
-        assert user.username == "validuser"
-    
-    def test_email_lowercase_normalization(self):
-        """Test email is normalized to lowercase."""
-        user = UserCreate(
-            username="testuser",
-            email="Test@EXAMPLE.com",
-            first_name="Test",
-            last_name="User",
-        )
+    @pytest.mark.parametrize(
+        "field,value,expected",
+        [
+            ("username", "ValidUser", "validuser"),
+            ("username", "test_user-123", "test_user-123"),
+            ("email", "Test@EXAMPLE.com", "test@example.com"),
+            ("first_name", "john", "John"),
+            ("last_name", "DOE", "Doe"),
+            ("first_name", "Mary-Jane", "Mary-Jane"),
+            ("last_name", "O'Brien", "O'Brien"),
+        ],
+        ids=[
+            "username_lowercase",
+            "username_special_chars",
+            "email_lowercase",
+            "first_name_title_case",
+            "last_name_title_case",
+            "first_name_hyphen",
+            "last_name_apostrophe",
+        ],
+    )
+    def test_valid_normalization(self, field, value, expected):
+        """Test accepted values are normalized as expected."""
+        user = UserCreate(**kw(**{field: value}))
         
-        assert user.email == "test@example.com"
-    
-    def test_name_title_case_normalization(self):
-        """Test names are normalized to title case."""
-        user = UserCreate(
-            username="testuser",
-            email="test@example.com",
-            first_name="john",
-            last_name="DOE",
-        )
-        
-        assert user.first_name == "John"
-        assert user.last_name == "Doe"
-    
-    def test_username_too_short(self):
-        """Test username validation - too short."""
+        assert getattr(user, field) == expected
+    
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("username", "ab"),
+            ("username", "a" * 51),
+            ("username", "test@user!"),
+            ("username", "test__user"),
+            ("email", "not-an-email"),
+            ("first_name", ""),
+            ("last_name", ""),
+        ],
+        ids=[
+            "username_too_short",
+            "username_too_long",
+            "username_invalid_characters",
+            "username_consecutive_special_chars",
+            "invalid_email",
+            "first_name_required",
+            "last_name_required",
+        ],
+    )
+    def test_invalid_field(self, field, value):
+        """Test invalid values are rejected for the offending field."""
         with pytest.raises(ValidationError) as exc_info:
-            UserCreate(
-                username="ab",
-                email="test@example.com",
-                first_name="Test",
-                last_name="User",
-            )
+            UserCreate(**kw(**{field: value}))
         
-        assert "username" in str(exc_info.value).lower()
-    
-    def test_username_too_long(self):
-        """Test username validation - too long."""
-        with pytest.raises(ValidationError):
-            UserCreate(
-                username="a" * 51,
-                email="test@example.com",
-                first_name="Test",
-                last_name="User",
-            )
-    
-    def test_username_invalid_characters(self):
-        """Test username validation - invalid characters."""
-        with pytest.raises(ValidationError):
-            UserCreate(
-                username="test@user!",
-                email="test@example.com",
-                first_name="Test",
-                last_name="User",
-            )
-    
-    def test_username_consecutive_special_chars(self):
-        """Test username validation - consecutive special characters."""
-        with pytest.raises(ValidationError):
-            UserCreate(
-                username="test__user",
-                email="test@example.com",
-                first_name="Test",
-                last_name="User",
-            )
-    
-    def test_valid_username_with_special_chars(self):
-        """Test valid username with allowed special characters."""
-        user = UserCreate(
-            username="test_user-123",
-            email="test@example.com",
-            first_name="Test",
-            last_name="User",
-        )
-        
-        assert user.username == "test_user-123"
-    
-    def test_invalid_email(self):
-        """Test email validation - invalid format."""
-        with pytest.raises(ValidationError):
-            UserCreate(
-                username="testuser",
-                email="not-an-email",
-                first_name="Test",
-                last_name="User",
-            )
-    
-    def test_first_name_required(self):
-        """Test first_name is required."""
-        with pytest.raises(ValidationError):
-            UserCreate(
-                username="testuser",
-                email="test@example.com",
-                first_name="",
-                last_name="User",
-            )
-    
-    def test_last_name_required(self):
-        """Test last_name is required."""
-        with pytest.raises(ValidationError):
-            UserCreate(
-                username="testuser",
-                email="test@example.com",
-                first_name="Test",
-                last_name="",
-            )
-    
-    def test_name_with_special_chars(self):
-        """Test names with allowed special characters."""
-        user = UserCreate(
-            username="testuser",
-            email="test@example.com",
-            first_name="Mary-Jane",
-            last_name="O'Brien",
-        )
-        
-        assert user.first_name == "Mary-Jane"
-        assert user.last_name == "O'Brien"
+        assert exc_info.value.errors()[0]["loc"] == (field,)
     
     def test_default_role(self):
         """Test default role is USER."""
-        user = UserCreate(
-            username="testuser",
-            email="test@example.com",
-            first_name="Test",
-            last_name="User",
-        )
+        user = UserCreate(**kw())
         
         assert user.role == UserRole.USER
     
     def test_default_active(self):
         """Test default active is True."""
-        user = UserCreate(
-            username="testuser",
-            email="test@example.com",
-            first_name="Test",
-            last_name="User",
-        )
+        user = UserCreate(**kw())
         
         assert user.active is True
     
-    def test_all_roles_valid(self):
-        """Test all role values are valid."""
-        for role in UserRole:
-            user = UserCreate(
-                username=f"testuser{role.value}",
-                email=f"test{role.value}@example.com",
-                first_name="Test",
-                last_name="User",
-                role=role,
-            )
-            assert user.role == role
+    @pytest.mark.parametrize("role", ROLES, ids=[role.value for role in ROLES])
+    def test_role_valid(self, role):
+        """Test each role value is valid."""
+        user = UserCreate(**kw(
+            username=f"testuser{role.value}",
+            email=f"test{role.value}@example.com",
+            role=role,
+        ))
+        
+        assert user.role == role
 
 
 class TestUserUpdateValidation:
@@ -202,11 +144,11 @@ class TestUserUpdateValidation:
     
     def test_partial_update_multiple_fields(self):
         """Test partial update with multiple fields."""
-        update = UserUpdate(
-            first_name="Updated",
-            last_name="Name",
-            role=UserRole.ADMIN,
-        )
+        update = _UPDATE_ADAPTER.validate_python({
+            "first_name": "Updated",
+            "last_name": "Name",
+            "role": UserRole.ADMIN,
+        })
         
         assert update.first_name == "Updated"
         assert update.last_name == "Name"
@@ -215,22 +157,28 @@ class TestUserUpdateValidation:
     def test_empty_update_raises_error(self):
         """Test that update with no fields raises error."""
         with pytest.raises(ValidationError) as exc_info:
-            UserUpdate()
+            _UPDATE_ADAPTER.validate_python({})
         
-        assert "at least one field" in str(exc_info.value).lower()
+        errors = exc_info.value.errors()
+        assert any(e["type"].startswith("value_error") for e in errors)
+        assert any("at least one field" in e["msg"].lower() for e in errors)
     
     def test_update_username_validation(self):
         """Test username validation still applies on update."""
-        with pytest.raises(ValidationError):
-            UserUpdate(username="ab")  # Too short
+        with pytest.raises(ValidationError) as exc_info:
+            _UPDATE_ADAPTER.validate_python({"username": "ab"})  # Too short
+        
+        assert exc_info.value.errors()[0]["loc"] == ("username",)
     
     def test_update_email_validation(self):
         """Test email validation still applies on update."""
-        with pytest.raises(ValidationError):
-            UserUpdate(email="not-an-email")
+        with pytest.raises(ValidationError) as exc_info:
+            _UPDATE_ADAPTER.validate_python({"email": "not-an-email"})
+        
+        assert exc_info.value.errors()[0]["loc"] == ("email",)
     
     def test_update_active_status(self):
         """Test updating active status."""
-        update = UserUpdate(active=False)
+        update = _UPDATE_ADAPTER.validate_python({"active": False})
         
         assert update.active is False
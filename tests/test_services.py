@@ -15,22 +15,29 @@ from app.services.user_service import UserService
 from app.utils.exceptions import ConflictException, NotFoundException
 
 
+USER_CREATE_DEFAULTS = {
+    "username": "newuser",
+    "email": "new@example.com",
+    "first_name": "New",
+    "last_name": "User",
+    "role": UserRole.USER,
+    "active": True,
+}
+
+
+def make_user_create(**overrides) -> UserCreate:
+    """Build a UserCreate from already-valid, normalized data without re-validating it."""
+    return UserCreate.model_construct(**{**USER_CREATE_DEFAULTS, **overrides})
+
+
 class TestUserServiceCreate:
     """Tests for UserService.create_user method."""
     
-    @pytest.mark.asyncio
     async def test_create_user_success(self, db_session):
         """Test successful user creation through service."""
         service = UserService(db_session)
         
-        user_data = UserCreate(
-            username="newuser",
-            email="new@example.com",
-            first_name="New",
-            last_name="User",
-            role=UserRole.USER,
-            active=True,
-        )
+        user_data = make_user_create()
         
         result = await service.create_user(user_data)
         
@@ -42,7 +49,18 @@ class TestUserServiceCreate:
         assert result.active is True
         assert result.id is not None
     
-    @pytest.mark.asyncio
+    async def test_create_user_applies_model_normalization(self, db_session):
+        """Test the model's @validates still normalizes data that skipped the schema."""
+        service = UserService(db_session)
+        
+        user_data = make_user_create(username="NewUser", email="New@Example.com", first_name=" New ")
+        
+        result = await service.create_user(user_data)
+        
+        assert result.username == "newuser"
+        assert result.email == "new@example.com"
+        assert result.first_name == "New"
+    
     async def test_create_user_duplicate_username(self, db_session, sample_user):
         """Test that duplicate username raises ConflictException."""
         service = UserService(db_session)
@@ -60,7 +78,6 @@ class TestUserServiceCreate:
         assert "already taken" in str(exc_info.value.message)
         assert exc_info.value.status_code == 409
     
-    @pytest.mark.asyncio
     async def test_create_user_duplicate_email(self, db_session, sample_user):
         """Test that duplicate email raises ConflictException."""
         service = UserService(db_session)
@@ -82,7 +99,6 @@ class TestUserServiceCreate:
 class TestUserServiceGet:
     """Tests for UserService get methods."""
     
-    @pytest.mark.asyncio
     async def test_get_user_success(self, db_session, sample_user):
         """Test getting user by ID."""
         service = UserService(db_session)
@@ -92,7 +108,6 @@ class TestUserServiceGet:
         assert result.id == sample_user.id
         assert result.username == sample_user.username
     
-    @pytest.mark.asyncio
     async def test_get_user_not_found(self, db_session):
         """Test that non-existent user raises NotFoundException."""
         service = UserService(db_session)
@@ -102,7 +117,6 @@ class TestUserServiceGet:
         
         assert exc_info.value.status_code == 404
     
-    @pytest.mark.asyncio
     async def test_get_user_by_username(self, db_session, sample_user):
         """Test getting user by username."""
         service = UserService(db_session)
@@ -111,7 +125,6 @@ class TestUserServiceGet:
         
         assert result.username == sample_user.username
     
-    @pytest.mark.asyncio
     async def test_get_user_by_email(self, db_session, sample_user):
         """Test getting user by email."""
         service = UserService(db_session)
@@ -124,7 +137,6 @@ class TestUserServiceGet:
 class TestUserServiceList:
     """Tests for UserService.list_users method."""
     
-    @pytest.mark.asyncio
     async def test_list_users_empty(self, db_session):
         """Test listing users when none exist."""
         service = UserService(db_session)
@@ -134,7 +146,6 @@ class TestUserServiceList:
         assert result.data == []
         assert result.meta.total == 0
     
-    @pytest.mark.asyncio
     async def test_list_users_with_pagination(self, db_session, user_factory):
         """Test pagination in list_users."""
         await user_factory.create_batch(25)
@@ -157,7 +168,6 @@ class TestUserServiceList:
         assert result.meta.has_next is False
         assert result.meta.has_prev is True
     
-    @pytest.mark.asyncio
     async def test_list_users_with_filters(self, db_session, sample_user, admin_user):
         """Test filtering in list_users."""
         service = UserService(db_session)
@@ -172,7 +182,6 @@ class TestUserServiceList:
 class TestUserServiceUpdate:
     """Tests for UserService.update_user method."""
     
-    @pytest.mark.asyncio
     async def test_update_user_success(self, db_session, sample_user):
         """Test successful user update."""
         service = UserService(db_session)
@@ -184,7 +193,6 @@ class TestUserServiceUpdate:
         assert result.last_name == "Name"
         assert result.username == sample_user.username
     
-    @pytest.mark.asyncio
     async def test_update_user_not_found(self, db_session):
         """Test updating non-existent user raises NotFoundException."""
         service = UserService(db_session)
@@ -194,7 +202,15 @@ class TestUserServiceUpdate:
         with pytest.raises(NotFoundException):
             await service.update_user("non-existent-id", update_data)
     
-    @pytest.mark.asyncio
+    async def test_update_user_not_found_with_taken_username(self, db_session, admin_user):
+        """Test a missing user is reported as not found before any conflict."""
+        service = UserService(db_session)
+        
+        update_data = UserUpdate(username=admin_user.username)
+        
+        with pytest.raises(NotFoundException):
+            await service.update_user("non-existent-id", update_data)
+    
     async def test_update_user_username_conflict(self, db_session, sample_user, admin_user):
         """Test updating to existing username raises ConflictException."""
         service = UserService(db_session)
@@ -206,7 +222,6 @@ class TestUserServiceUpdate:
         
         assert "already taken" in str(exc_info.value.message)
     
-    @pytest.mark.asyncio
     async def test_update_user_same_username_allowed(self, db_session, sample_user):
         """Test user can update with same username (no conflict with self)."""
         service = UserService(db_session)
@@ -215,25 +230,33 @@ class TestUserServiceUpdate:
         result = await service.update_user(sample_user.id, update_data)
         
         assert result.first_name == "Updated"
+    
+    async def test_update_user_applies_model_normalization(self, db_session, sample_user):
+        """Test the model's @validates still normalizes update values."""
+        service = UserService(db_session)
+        
+        update_data = UserUpdate.model_construct(email="Other@Example.com", last_name=" Name ")
+        result = await service.update_user(sample_user.id, update_data)
+        
+        assert result.email == "other@example.com"
+        assert result.last_name == "Name"
 
 
 class TestUserServiceDelete:
     """Tests for UserService.delete_user method."""
     
-    @pytest.mark.asyncio
     async def test_delete_user_success(self, db_session, sample_user):
         """Test successful user deletion."""
         service = UserService(db_session)
         
         result = await service.delete_user(sample_user.id)
         
-        assert result is True
+        assert result == sample_user.id
         
         # Verify user is deleted
         with pytest.raises(NotFoundException):
             await service.get_user(sample_user.id)
     
-    @pytest.mark.asyncio
     async def test_delete_user_not_found(self, db_session):
         """Test deleting non-existent user raises NotFoundException."""
         service = UserService(db_session)
@@ -245,7 +268,6 @@ class TestUserServiceDelete:
 class TestUserServiceActivation:
     """Tests for user activation/deactivation."""
     
-    @pytest.mark.asyncio
     async def test_deactivate_user(self, db_session, sample_user):
         """Test user deactivation."""
         service = UserService(db_session)
@@ -254,7 +276,6 @@ class TestUserServiceActivation:
         
         assert result.active is False
     
-    @pytest.mark.asyncio
     async def test_activate_user(self, db_session, inactive_user):
         """Test user activation."""
         service = UserService(db_session)
@@ -267,8 +288,7 @@ class TestUserServiceActivation:
 class TestUserServiceStatistics:
     """Tests for UserService.get_user_statistics method."""
     
-    @pytest.mark.asyncio
-    async def test_get_statistics(self, db_session, sample_user, admin_user, inactive_user):
+    async def test_get_statistics(self, db_session, stats_seed):
         """Test getting user statistics."""
         service = UserService(db_session)
         
@@ -10,14 +10,52 @@ from httpx import AsyncClient
 
 from app.models.user import User
 
+# Shared fields for create payloads; tests add only what they exercise
+_BASE_USER = {"first_name": "Test", "last_name": "User"}
+
+
+def _payload(**over) -> dict:
+    """Build a create-user payload from the shared template."""
+    return {**_BASE_USER, **over}
+
+
+async def _status_only(client: AsyncClient, method: str, url: str, **kwargs) -> int:
+    """
+    Send a request and return only its status code.
+    
+    Used by tests that assert nothing but the status. With ASGITransport the
+    body is buffered in-process either way, so this is a readability helper.
+    """
+    async with client.stream(method, url, **kwargs) as response:
+        return response.status_code
+
+
+class _ClassSharedSampleUser:
+    """Mixin sharing one sample_user row across all tests of a class."""
+    
+    @pytest.fixture
+    def db_connection(self, class_db_connection):
+        """Run the class's tests in one outer transaction."""
+        return class_db_connection
+    
+    @pytest.fixture
+    def sample_user(self, class_sample_user):
+        """Reuse the class-wide sample user; each test's changes roll back with its SAVEPOINT."""
+        return class_sample_user
+
 
 class TestCreateUser:
     """Tests for POST /api/v1/users endpoint."""
     
-    @pytest.mark.asyncio
-    async def test_create_user_success(self, client: AsyncClient, valid_user_data: dict):
+    async def test_create_user_success(
+        self, client: AsyncClient, valid_user_data: dict, valid_user_body: bytes
+    ):
         """Test successful user creation."""
-        response = await client.post("/api/v1/users", json=valid_user_data)
+        response = await client.post(
+            "/api/v1/users",
+            content=valid_user_body,
+            headers={"Content-Type": "application/json"},
+        )
         
         assert response.status_code == 201
         data = response.json()
@@ -32,22 +70,15 @@ class TestCreateUser:
         assert "created_at" in data
         assert "updated_at" in data
     
-    @pytest.mark.asyncio
     async def test_create_user_default_role(self, client: AsyncClient):
         """Test that default role is 'user' when not specified."""
-        user_data = {
-            "username": "defaultrole",
-            "email": "default@example.com",
-            "first_name": "Default",
-            "last_name": "Role",
-        }
+        user_data = _payload(username="defaultrole", email="default@example.com")
         
         response = await client.post("/api/v1/users", json=user_data)
         
         assert response.status_code == 201
         assert response.json()["role"] == "user"
     
-    @pytest.mark.asyncio
     async def test_create_user_duplicate_username(
         self, client: AsyncClient, sample_user: User, valid_user_data: dict
     ):
@@ -58,9 +89,8 @@ class TestCreateUser:
         response = await client.post("/api/v1/users", json=valid_user_data)
         
         assert response.status_code == 409
-        assert "already taken" in response.json()["error"]["message"]
+        assert response.json()["error"]["code"] == "USERNAME_TAKEN"
     
-    @pytest.mark.asyncio
     async def test_create_user_duplicate_email(
         self, client: AsyncClient, sample_user: User, valid_user_data: dict
     ):
@@ -71,64 +101,39 @@ class TestCreateUser:
         response = await client.post("/api/v1/users", json=valid_user_data)
         
         assert response.status_code == 409
-        assert "already registered" in response.json()["error"]["message"]
+        assert response.json()["error"]["code"] == "EMAIL_REGISTERED"
     
-    @pytest.mark.asyncio
     async def test_create_user_invalid_email(self, client: AsyncClient):
         """Test that invalid email returns 422."""
-        user_data = {
-            "username": "validuser",
-            "email": "not-an-email",
-            "first_name": "Test",
-            "last_name": "User",
-        }
-        
-        response = await client.post("/api/v1/users", json=user_data)
+        user_data = _payload(username="validuser", email="not-an-email")
         
-        assert response.status_code == 422
+        assert await _status_only(client, "POST", "/api/v1/users", json=user_data) == 422
     
-    @pytest.mark.asyncio
     async def test_create_user_username_too_short(self, client: AsyncClient):
         """Test that username too short returns 422."""
-        user_data = {
-            "username": "ab",
-            "email": "test@example.com",
-            "first_name": "Test",
-            "last_name": "User",
-        }
+        user_data = _payload(username="ab", email="test@example.com")
         
-        response = await client.post("/api/v1/users", json=user_data)
-        
-        assert response.status_code == 422
+        assert await _status_only(client, "POST", "/api/v1/users", json=user_data) == 422
     
-    @pytest.mark.asyncio
     async def test_create_user_normalizes_username(self, client: AsyncClient):
         """Test that username is normalized to lowercase."""
-        user_data = {
-            "username": "TestUser",
-            "email": "test@example.com",
-            "first_name": "Test",
-            "last_name": "User",
-        }
+        user_data = _payload(username="TestUser", email="test@example.com")
         
         response = await client.post("/api/v1/users", json=user_data)
         
         assert response.status_code == 201
         assert response.json()["username"] == "testuser"
     
-    @pytest.mark.asyncio
     async def test_create_user_all_roles(self, client: AsyncClient):
         """Test creating users with all role types."""
         roles = ["admin", "user", "guest"]
         
         for i, role in enumerate(roles):
-            user_data = {
-                "username": f"roletest{i}",
-                "email": f"roletest{i}@example.com",
-                "first_name": "Role",
-                "last_name": "Test",
-                "role": role,
-            }
+            user_data = _payload(
+                username=f"roletest{i}",
+                email=f"roletest{i}@example.com",
+                role=role,
+            )
             
             response = await client.post("/api/v1/users", json=user_data)
             
@@ -136,10 +141,9 @@ class TestCreateUser:
             assert response.json()["role"] == role
 
 
-class TestGetUser:
+class TestGetUser(_ClassSharedSampleUser):
     """Tests for GET /api/v1/users/{id} endpoint."""
     
-    @pytest.mark.asyncio
     async def test_get_user_success(self, client: AsyncClient, sample_user: User):
         """Test successful user retrieval by ID."""
         response = await client.get(f"/api/v1/users/{sample_user.id}")
@@ -151,7 +155,6 @@ class TestGetUser:
         assert data["username"] == sample_user.username
         assert data["email"] == sample_user.email
     
-    @pytest.mark.asyncio
     async def test_get_user_not_found(self, client: AsyncClient):
         """Test that non-existent user returns 404."""
         response = await client.get("/api/v1/users/non-existent-id")
@@ -159,7 +162,6 @@ class TestGetUser:
         assert response.status_code == 404
         assert response.json()["error"]["code"] == "NOT_FOUND"
     
-    @pytest.mark.asyncio
     async def test_get_user_by_username(self, client: AsyncClient, sample_user: User):
         """Test user retrieval by username."""
         response = await client.get(f"/api/v1/users/by-username/{sample_user.username}")
@@ -167,7 +169,6 @@ class TestGetUser:
         assert response.status_code == 200
         assert response.json()["username"] == sample_user.username
     
-    @pytest.mark.asyncio
     async def test_get_user_by_email(self, client: AsyncClient, sample_user: User):
         """Test user retrieval by email."""
         response = await client.get(f"/api/v1/users/by-email/{sample_user.email}")
@@ -179,7 +180,6 @@ class TestGetUser:
 class TestListUsers:
     """Tests for GET /api/v1/users endpoint."""
     
-    @pytest.mark.asyncio
     async def test_list_users_empty(self, client: AsyncClient):
         """Test listing users when database is empty."""
         response = await client.get("/api/v1/users")
@@ -190,23 +190,21 @@ class TestListUsers:
         assert data["data"] == []
         assert data["meta"]["total"] == 0
     
-    @pytest.mark.asyncio
     async def test_list_users_with_data(self, client: AsyncClient, user_factory):
         """Test listing users with data."""
-        await user_factory.create_batch(5)
+        users = await user_factory.create_batch(5)
         
         response = await client.get("/api/v1/users")
         
         assert response.status_code == 200
         data = response.json()
         
-        assert len(data["data"]) == 5
+        assert {u["id"] for u in data["data"]} == {u.id for u in users}
         assert data["meta"]["total"] == 5
     
-    @pytest.mark.asyncio
     async def test_list_users_pagination(self, client: AsyncClient, user_factory):
         """Test pagination works correctly."""
-        await user_factory.create_batch(15)
+        users = await user_factory.create_batch(15)
         
         # First page
         response = await client.get("/api/v1/users?page=1&page_size=10")
@@ -226,45 +224,71 @@ class TestListUsers:
         assert data["meta"]["page"] == 2
         assert data["meta"]["has_next"] is False
         assert data["meta"]["has_prev"] is True
+        
+        # Keyset pagination: first page
+        response = await client.get("/api/v1/users?page_size=10&cursor=")
+        data = response.json()
+        first_ids = [u["id"] for u in data["data"]]
+        next_cursor = data["meta"]["next_cursor"]
+        
+        assert len(first_ids) == 10
+        assert first_ids == sorted(first_ids)
+        assert data["meta"]["has_next"] is True
+        assert data["meta"]["has_prev"] is False
+        assert data["meta"]["total"] is None
+        assert next_cursor
+        
+        # Keyset pagination: following page from next_cursor
+        response = await client.get(f"/api/v1/users?page_size=10&cursor={next_cursor}")
+        data = response.json()
+        second_ids = [u["id"] for u in data["data"]]
+        
+        assert len(second_ids) == 5
+        assert min(second_ids) > max(first_ids)
+        assert {*first_ids, *second_ids} == {u.id for u in users}
+        assert data["meta"]["has_next"] is False
+        assert data["meta"]["has_prev"] is True
+        assert data["meta"]["next_cursor"] is None
     
-    @pytest.mark.asyncio
-    async def test_list_users_filter_by_role(
-        self, client: AsyncClient, sample_user: User, admin_user: User
-    ):
+    async def test_list_users_invalid_cursor(self, client: AsyncClient):
+        """Test that a malformed cursor returns 422."""
+        assert await _status_only(client, "GET", "/api/v1/users?cursor=%25%25%25") == 422
+    
+    async def test_list_users_filter_by_role(self, client: AsyncClient, stats_seed):
         """Test filtering by role."""
         response = await client.get("/api/v1/users?role=admin")
         
         assert response.status_code == 200
         data = response.json()
         
-        assert len(data["data"]) == 1
-        assert data["data"][0]["role"] == "admin"
+        assert {u["id"] for u in data["data"]} == {stats_seed.admin.id}
+        assert {u["role"] for u in data["data"]} == {"admin"}
     
-    @pytest.mark.asyncio
-    async def test_list_users_filter_by_active(
-        self, client: AsyncClient, sample_user: User, inactive_user: User
-    ):
+    async def test_list_users_filter_by_active(self, client: AsyncClient, stats_seed):
         """Test filtering by active status."""
         response = await client.get("/api/v1/users?active=false")
         
         assert response.status_code == 200
         data = response.json()
         
-        assert len(data["data"]) == 1
-        assert data["data"][0]["active"] is False
+        assert {u["id"] for u in data["data"]} == {stats_seed.inactive.id}
+        assert {u["active"] for u in data["data"]} == {False}
     
-    @pytest.mark.asyncio
-    async def test_list_users_search(self, client: AsyncClient, sample_user: User):
-        """Test search functionality."""
-        response = await client.get(f"/api/v1/users?search={sample_user.first_name}")
+    async def test_list_users_search(
+        self, client: AsyncClient, sample_user: User, user_factory
+    ):
+        """Test search matches a case-insensitive prefix, not a substring."""
+        # Contains "sam" but does not start with it in any field
+        await user_factory.create(username="xsamuser", email="x@example.com", first_name="Osama")
+        
+        prefix = sample_user.first_name[:3]
+        response = await client.get(f"/api/v1/users?search={prefix}")
         
         assert response.status_code == 200
         data = response.json()
         
-        assert len(data["data"]) >= 1
-        assert any(u["first_name"] == sample_user.first_name for u in data["data"])
+        assert {u["id"] for u in data["data"]} == {sample_user.id}
     
-    @pytest.mark.asyncio
     async def test_list_users_sorting(self, client: AsyncClient, user_factory):
         """Test sorting functionality."""
         await user_factory.create(username="aaa_user")
@@ -278,10 +302,9 @@ class TestListUsers:
         assert usernames == sorted(usernames)
 
 
-class TestUpdateUser:
+class TestUpdateUser(_ClassSharedSampleUser):
     """Tests for PUT /api/v1/users/{id} endpoint."""
     
-    @pytest.mark.asyncio
     async def test_update_user_success(self, client: AsyncClient, sample_user: User):
         """Test successful user update."""
         update_data = {
@@ -298,16 +321,14 @@ class TestUpdateUser:
         assert data["last_name"] == "Name"
         assert data["username"] == sample_user.username  # Unchanged
     
-    @pytest.mark.asyncio
     async def test_update_user_not_found(self, client: AsyncClient):
         """Test updating non-existent user returns 404."""
         update_data = {"first_name": "Test"}
         
-        response = await client.put("/api/v1/users/non-existent-id", json=update_data)
-        
-        assert response.status_code == 404
+        assert await _status_only(
+            client, "PUT", "/api/v1/users/non-existent-id", json=update_data
+        ) == 404
     
-    @pytest.mark.asyncio
     async def test_update_user_username_conflict(
         self, client: AsyncClient, sample_user: User, admin_user: User
     ):
@@ -317,8 +338,8 @@ class TestUpdateUser:
         response = await client.put(f"/api/v1/users/{sample_user.id}", json=update_data)
         
         assert response.status_code == 409
+        assert response.json()["error"]["code"] == "USERNAME_TAKEN"
     
-    @pytest.mark.asyncio
     async def test_update_user_email_conflict(
         self, client: AsyncClient, sample_user: User, admin_user: User
     ):
@@ -328,8 +349,8 @@ class TestUpdateUser:
         response = await client.put(f"/api/v1/users/{sample_user.id}", json=update_data)
         
         assert response.status_code == 409
+        assert response.json()["error"]["code"] == "EMAIL_REGISTERED"
     
-    @pytest.mark.asyncio
     async def test_update_user_role(self, client: AsyncClient, sample_user: User):
         """Test updating user role."""
         update_data = {"role": "admin"}
@@ -339,7 +360,6 @@ class TestUpdateUser:
         assert response.status_code == 200
         assert response.json()["role"] == "admin"
     
-    @pytest.mark.asyncio
     async def test_partial_update_user(self, client: AsyncClient, sample_user: User):
         """Test PATCH endpoint for partial update."""
         update_data = {"first_name": "Patched"}
@@ -353,29 +373,21 @@ class TestUpdateUser:
 class TestDeleteUser:
     """Tests for DELETE /api/v1/users/{id} endpoint."""
     
-    @pytest.mark.asyncio
     async def test_delete_user_success(self, client: AsyncClient, sample_user: User):
         """Test successful user deletion."""
         response = await client.delete(f"/api/v1/users/{sample_user.id}")
         
         assert response.status_code == 204
-        
-        # Verify user is deleted
-        get_response = await client.get(f"/api/v1/users/{sample_user.id}")
-        assert get_response.status_code == 404
+        assert response.headers["X-Deleted-Id"] == sample_user.id
     
-    @pytest.mark.asyncio
     async def test_delete_user_not_found(self, client: AsyncClient):
         """Test deleting non-existent user returns 404."""
-        response = await client.delete("/api/v1/users/non-existent-id")
-        
-        assert response.status_code == 404
+        assert await _status_only(client, "DELETE", "/api/v1/users/non-existent-id") == 404
 
 
 class TestUserActivation:
     """Tests for user activation/deactivation endpoints."""
     
-    @pytest.mark.asyncio
     async def test_deactivate_user(self, client: AsyncClient, sample_user: User):
         """Test user deactivation."""
         response = await client.post(f"/api/v1/users/{sample_user.id}/deactivate")
@@ -383,7 +395,6 @@ class TestUserActivation:
         assert response.status_code == 200
         assert response.json()["active"] is False
     
-    @pytest.mark.asyncio
     async def test_activate_user(self, client: AsyncClient, inactive_user: User):
         """Test user activation."""
         response = await client.post(f"/api/v1/users/{inactive_user.id}/activate")
@@ -391,21 +402,15 @@ class TestUserActivation:
         assert response.status_code == 200
         assert response.json()["active"] is True
     
-    @pytest.mark.asyncio
     async def test_deactivate_not_found(self, client: AsyncClient):
         """Test deactivating non-existent user."""
-        response = await client.post("/api/v1/users/non-existent-id/deactivate")
-        
-        assert response.status_code == 404
+        assert await _status_only(client, "POST", "/api/v1/users/non-existent-id/deactivate") == 404
 
 
 class TestUserStatistics:
     """Tests for GET /api/v1/users/statistics endpoint."""
     
-    @pytest.mark.asyncio
-    async def test_get_statistics(
-        self, client: AsyncClient, sample_user: User, admin_user: User, inactive_user: User
-    ):
+    async def test_get_statistics(self, client: AsyncClient, stats_seed):
         """Test statistics endpoint."""
         response = await client.get("/api/v1/users/statistics")
         
@@ -419,3 +424,4 @@ class TestUserStatistics:
         assert data["total_users"] == 3
         assert data["active_users"] == 2
         assert data["inactive_users"] == 1
+        assert sum(data["by_role"].values()) == data["total_users"]